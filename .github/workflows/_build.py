@@ -1,30 +1,35 @@
 from portray import config, render  # type: ignore
 from typing import Any
-import yaml
+import pymdownx.superfences  # type: ignore
 
 # Note that this does not work for reloads.
 mkdocs = config.mkdocs
 
+SUPERFENCES: dict[str, Any] = {
+    "preserve_tabs": True,
+    "custom_fences": [
+        # Mermaid diagrams
+        {
+            "name": "mermaid",
+            "class": "mermaid",
+            "format": pymdownx.superfences.fence_code_format,
+        }
+    ],
+}
+
 
 def _mkdocs(directory: str, **overrides) -> dict:  # type: ignore
-    superfences = yaml.unsafe_load("""
-      preserve_tabs: true
-      custom_fences:
-        # Mermaid diagrams
-        - name: mermaid
-          class: mermaid
-          format: !!python/name:pymdownx.superfences.fence_code_format
-    """)
-    overrides.setdefault("markdown_extensions", [])
-    for n, ext in enumerate(overrides["markdown_extensions"]):
+    extensions = list(overrides.get("markdown_extensions", []))
+    for n, ext in enumerate(extensions):
         if ext == "pymdownx.superfences":
             ext = {"pymdownx.superfences": {}}
         elif isinstance(ext, dict) and len(ext) == 1 and "pymdownx.superfences" in ext:
-            ...
+            ext = {"pymdownx.superfences": dict(ext["pymdownx.superfences"])}
         else:
             continue
-        ext["pymdownx.superfences"].update(superfences)
-        overrides["markdown_extensions"][n] = ext
+        ext["pymdownx.superfences"].update(SUPERFENCES)
+        extensions[n] = ext
+    overrides["markdown_extensions"] = extensions
     res: dict[Any, Any] = mkdocs(directory, **overrides)
     return res
 
@@ -36,13 +41,14 @@ mkdocs_render = render.mkdocs
 
 def _mkdocs_render(config: dict[str, Any]) -> Any:
     """Ensures the original config can be reused."""
-    original_config = list(config.get("markdown_extensions", []))
-    if original_config and "pymdownx.superfences" in original_config[0]:
-        original_config = original_config[0]["pymdownx.superfences"]
-        result = mkdocs_render(config)
-        config["markdown_extensions"][0]["pymdownx.superfences"] = original_config
-    else:
-        result = mkdocs_render(config)
+    extensions = config.get("markdown_extensions")
+    first = extensions[0] if extensions else None
+    if not isinstance(first, dict) or "pymdownx.superfences" not in first:
+        return mkdocs_render(config)
+
+    original_config = first["pymdownx.superfences"]
+    result = mkdocs_render(config)
+    config["markdown_extensions"][0]["pymdownx.superfences"] = original_config
     return result
 
 
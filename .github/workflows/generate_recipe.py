@@ -1,9 +1,10 @@
 import textwrap
 import os
-import toml
+import re
+import tomllib
 
-with open("pyproject.toml") as f:
-    pyproject = toml.load(f)
+with open("pyproject.toml", "rb") as f:
+    pyproject = tomllib.load(f)
 
 with open("README.md") as f:
     readme_string = f.read()
@@ -17,7 +18,11 @@ deps = pyproject["project"]["dependencies"]
 deps_string = ""
 for dep in deps:
     deps_string += f"    - {dep}\n"
-TEMPLATE = TEMPLATE.replace("__PROJECT_DEPENDENCIES__", deps_string)
-TEMPLATE = TEMPLATE.replace("__README__", readme_string)
+substitutions = {
+    "__PROJECT_DEPENDENCIES__": deps_string,
+    "__README__": readme_string,
+}
+placeholders = re.compile("|".join(map(re.escape, substitutions)))
+TEMPLATE = placeholders.sub(lambda match: substitutions[match.group(0)], TEMPLATE)
 with open("recipe.yaml", "w") as f:
     f.write(TEMPLATE)
@@ -22,11 +22,8 @@ rule download_data_cbb4d1260b8b17d6693986ebfd833d53:
         output_file="generated_smk/data/test_data.txt"
     run:
         import snakemake_tasks
-
-
         snakemake_tasks.download_data(data=params.data, output_file=params.output_file)
 
-
 rule generate_report_b1f9747ed9903dcd9571246547b1767b:
     input:
         processed_data=rules.process_data_75213b5c31fed773cd1f7ca1dfb6ab5a.output.output_file
@@ -38,11 +35,7 @@ rule generate_report_b1f9747ed9903dcd9571246547b1767b:
         output_file="results/report.txt"
     run:
         import snakemake_tasks
-
-
-        snakemake_tasks.generate_report(processed_data=params.processed_data, multiple_arg=params.multiple_arg,
-        output_file=params.output_file)
-
+        snakemake_tasks.generate_report(processed_data=params.processed_data, multiple_arg=params.multiple_arg, output_file=params.output_file)
 
 rule process_data_75213b5c31fed773cd1f7ca1dfb6ab5a:
     input:
@@ -55,10 +48,7 @@ rule process_data_75213b5c31fed773cd1f7ca1dfb6ab5a:
         output_file="generated_smk/data/processed_data.txt"
     run:
         import snakemake_tasks
-
-
-        snakemake_tasks.process_data(data_file=params.data_file, multiple_arg=params.multiple_arg,
-        output_file=params.output_file)
+        snakemake_tasks.process_data(data_file=params.data_file, multiple_arg=params.multiple_arg, output_file=params.output_file)
 
 In order to make the snakemake file be executable you need to:
 - manually add:
@@ -66,11 +56,9 @@ rule all:
     input:
         "results/report.txt" # To make sure all connected rules are executed. For more information https://snakemake.readthedocs.io/
 - Change the order of the rules to match the order of execution.
-- Make sure all methods in run blocks are on the same line.
 - Remove @task annotation from the snakemake_workflow.py
 """
 
-import yaml
 from dewret.tasks import task, construct
 from dewret.renderers.snakemake import render
 
@@ -164,13 +152,4 @@ if __name__ == "__main__":
     smk_output = render(workflow)
 
     with open("Snakefile", "w") as file:
-        trans_table = str.maketrans(
-            {
-                "-": "   ",
-                "'": "",
-                "[": "",
-                "]": "",
-            }
-        )
-        smk_text = yaml.dump(smk_output, indent=4).translate(trans_table)
-        file.write(smk_text)
+        file.write(smk_output["__root__"])
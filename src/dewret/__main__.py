@@ -22,7 +22,7 @@ this may be of use.
 import importlib
 import importlib.util
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
 import sys
 import re
 import yaml
@@ -34,13 +34,49 @@ import json
 from .core import (
     set_configuration,
     set_render_configuration,
-    RawRenderModule,
-    StructuredRenderModule,
+    is_raw_render_module,
+    is_structured_render_module,
 )
 from .utils import load_module_or_package
-from .render import get_render_method, write_rendered_output
+from .render import get_lazy_render_method, write_rendered_output
 from .tasks import Backend, construct
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore
+
+RENDERER_NAME = re.compile(r"^([a-z_0-9-.]+)$")
+
+
+def _load_args_file(path: Path) -> Any:
+    """Load options from a JSON or YAML file."""
+    if path.suffix == ".json":
+        return json.loads(path.read_bytes())
+
+    with path.open() as path_f:
+        return yaml.load(path_f, Loader=_Loader)
+
+
+def _parse_key_vals(pairs: str) -> dict[str, Any]:
+    """Parse a comma-separated list of key:val pairs in a single pass.
+
+    Values are read as JSON where possible, so that `true`, `false` and numbers
+    have their proper types, and are otherwise kept as strings.
+    """
+    parsed: dict[str, Any] = {}
+    for pair in pairs.split(","):
+        key, sep, val = pair.partition(":")
+        if not sep:
+            raise RuntimeError(
+                f"Options should be specified as key:val,key:val,..., but found '{pair}'"
+            )
+        try:
+            parsed[key] = json.loads(val)
+        except ValueError:
+            parsed[key] = val
+    return parsed
+
 
 @click.command()
 @click.option(
@@ -84,18 +120,18 @@ def render(
     sys.path.append(str(workflow_py.parent))
     kwargs = {}
     for arg in arguments:
-        if ":" not in arg:
+        key, sep, val = arg.partition(":")
+        if not sep:
             raise RuntimeError(
                 "Arguments should be specified as key:val, where val is a JSON representation of the argument"
             )
-        key, val = arg.split(":", 1)
         kwargs[key] = json.loads(val)
 
     render_module: Path | ModuleType
-    if mtch := re.match(r"^([a-z_0-9-.]+)$", renderer):
+    if mtch := RENDERER_NAME.match(renderer):
         render_module = importlib.import_module(f"dewret.renderers.{mtch.group(1)}")
-        if not isinstance(render_module, RawRenderModule) and not isinstance(
-            render_module, StructuredRenderModule
+        if not is_raw_render_module(render_module) and not is_structured_render_module(
+            render_module
         ):
             raise NotImplementedError(
                 "The imported render module does not seem to match the `RawRenderModule` or `StructuredRenderModule` protocols."
@@ -108,22 +144,23 @@ def render(
         )
 
     if construct_args.startswith("@"):
-        with Path(construct_args[1:]).open() as construct_args_f:
-            construct_kwargs = yaml.safe_load(construct_args_f)
+        construct_kwargs = _load_args_file(Path(construct_args[1:]))
     elif not construct_args:
         construct_kwargs = {}
     else:
-        construct_kwargs = dict(pair.split(":") for pair in construct_args.split(","))
+        construct_kwargs = _parse_key_vals(construct_args)
 
     renderer_kwargs: dict[str, Any]
     if renderer_args.startswith("@"):
-        with Path(renderer_args[1:]).open() as renderer_args_f:
-            renderer_kwargs = yaml.safe_load(renderer_args_f)
+        renderer_kwargs = _load_args_file(Path(renderer_args[1:]))
     elif not renderer_args:
         renderer_kwargs = {}
     else:
-        renderer_kwargs = dict(pair.split(":") for pair in renderer_args.split(","))
+        renderer_kwargs = _parse_key_vals(renderer_args)
 
+    # Output files stay open until everything is written, as the same file may be
+    # opened several times (e.g. to append each subworkflow).
+    output_files = ExitStack()
     if output == "-":
 
         @contextmanager
@@ -134,16 +171,20 @@ def render(
 
         opener = _opener
     else:
+        open_files: dict[str, IO[Any]] = {}
 
         @contextmanager
         def _opener(key: str, mode: str) -> Generator[IO[Any], None, None]:
             output_file = output.replace("%", key)
-            with Path(output_file).open(mode) as output_f:
-                yield output_f
+            if output_file not in open_files:
+                open_files[output_file] = output_files.enter_context(
+                    Path(output_file).open(mode)
+                )
+            yield open_files[output_file]
 
         opener = _opener
 
-    render = get_render_method(render_module, pretty=pretty)
+    render = get_lazy_render_method(render_module, pretty=pretty)
     pkg = "__workflow__"
     workflow = load_module_or_package(pkg, workflow_py)
     task_fn = getattr(workflow, task)
@@ -156,13 +197,16 @@ def render(
             rendered = render(
                 construct(task_fn(**kwargs), **construct_kwargs), **renderer_kwargs
             )
+        # Each (sub)workflow is only serialized as it is written out, so
+        # serialization errors surface here rather than in the render call.
+        with output_files:
+            write_rendered_output(rendered, output, opener)
     except Exception as exc:
         import traceback
 
         print(exc, exc.__cause__, exc.__context__)
         traceback.print_exc()
-    else:
-        write_rendered_output(rendered, output, opener)
 
 
-render()
+if __name__ == "__main__":
+    render()
@@ -3,6 +3,8 @@
 
 import builtins
 import dis
+from functools import lru_cache
+from types import CodeType
 from inspect import (
     ClosureVars,
     ismethod,
@@ -11,6 +13,12 @@ from inspect import (
 )
 from typing import Callable, Any
 
+LOAD_ATTR = dis.opmap["LOAD_ATTR"]
+IMPORT_NAME = dis.opmap["IMPORT_NAME"]
+IMPORT_FROM = dis.opmap["IMPORT_FROM"]
+LOAD_FAST = dis.opmap["LOAD_FAST"]
+LOAD_GLOBAL = dis.opmap["LOAD_GLOBAL"]
+
 
 def getclosurevars(func: Callable[..., Any]) -> ClosureVars:
     if ismethod(func):
@@ -25,10 +33,13 @@ def getclosurevars(func: Callable[..., Any]) -> ClosureVars:
     if func.__closure__ is None:
         nonlocal_vars = {}
     else:
-        nonlocal_vars = {
-            var: cell.cell_contents
-            for var, cell in zip(code.co_freevars, func.__closure__, strict=False)
-        }
+        nonlocal_vars = dict(
+            zip(
+                code.co_freevars,
+                (cell.cell_contents for cell in func.__closure__),
+                strict=False,
+            )
+        )
 
     # Global and builtin references are named in co_names and resolved
     # by looking them up in __globals__ or __builtins__
@@ -36,21 +47,33 @@ def getclosurevars(func: Callable[..., Any]) -> ClosureVars:
     builtin_ns = global_ns.get("__builtins__", builtins.__dict__)
     if ismodule(builtin_ns):
         builtin_ns = builtin_ns.__dict__
-    global_vars = {}
-    builtin_vars = {}
-    unbound_names = set()
-    global_names = set()
+    global_names, import_names = _scan_code(code)
+    global_keys = global_names & global_ns.keys()
+    builtin_keys = (global_names - global_keys) & builtin_ns.keys()
+    global_vars = {name: global_ns[name] for name in global_keys}
+    builtin_vars = {name: builtin_ns[name] for name in builtin_keys}
+    unbound_names = set(import_names) | (global_names - global_keys - builtin_keys)
+
+    return ClosureVars(nonlocal_vars, global_vars, builtin_vars, unbound_names)
+
+
+@lru_cache
+def _scan_code(code: CodeType) -> tuple[frozenset[str], frozenset[str]]:
+    # The bytecode scan only depends on the code object, so it is cached,
+    # while the names are resolved against the function on every call.
+    global_names: set[str] = set()
+    unbound_names: set[str] = set()
     stackm1 = None
     imports: dict[str, str] = {}
     for instruction in dis.get_instructions(code):
-        opname = instruction.opname
+        opcode = instruction.opcode
         name = instruction.argval
         # TODO: this does not cover the possibility of a subsequent
         # variable shadowing an inline import
-        if opname == "LOAD_ATTR" and stackm1 and (fullname := imports.get(stackm1)):
+        if opcode == LOAD_ATTR and stackm1 and (fullname := imports.get(stackm1)):
             unbound_names.add(f"{stackm1}.{name}:{fullname}.{name}")
             stackm1 = None
-        elif opname == "IMPORT_NAME":
+        elif opcode == IMPORT_NAME:
             # TODO: deal with STACK[-2]
             # Strictly, these only enter the namespace with a
             # subsequent STORE_FAST, present in normal circumstances.
@@ -60,22 +83,13 @@ def getclosurevars(func: Callable[..., Any]) -> ClosureVars:
                 fullname = name
             imports[name] = fullname
             stackm1 = name
-        elif opname == "IMPORT_FROM":
+        elif opcode == IMPORT_FROM:
             fullname = f"{stackm1}.{name}"
             unbound_names.add(f"{name}:{fullname}")
             imports[name] = fullname
             stackm1 = name
-        elif opname == "LOAD_FAST":
+        elif opcode == LOAD_FAST:
             stackm1 = name
-        elif opname == "LOAD_GLOBAL":
+        elif opcode == LOAD_GLOBAL:
             global_names.add(name)
-    for name in global_names:
-        try:
-            global_vars[name] = global_ns[name]
-        except KeyError:
-            try:
-                builtin_vars[name] = builtin_ns[name]
-            except KeyError:
-                unbound_names.add(name)
-
-    return ClosureVars(nonlocal_vars, global_vars, builtin_vars, unbound_names)
+    return frozenset(global_names), frozenset(unbound_names)
@@ -23,14 +23,16 @@ import ast
 import sys
 import importlib
 from ._cpython_mod import getclosurevars
+from .core import call_cached
 from functools import lru_cache
-from types import FunctionType, ModuleType
+from inspect import ClosureVars
+from types import FunctionType, MappingProxyType, ModuleType
 from typing import (
     Any,
     TypeVar,
     Annotated,
     Callable,
-    get_origin,
+    Iterator,
     get_args,
     Mapping,
     get_type_hints,
@@ -39,18 +41,102 @@ from typing import (
 T = TypeVar("T")
 AtRender = Annotated[T, "AtRender"]
 Fixed = Annotated[T, "Fixed"]
+_AnnotatedAlias = type(Fixed)
+
+
+def get_module_type_hints(mod: ModuleType) -> Mapping[str, Any]:
+    """Get the type hints for the globals of a module.
+
+    Resolving a module's hints evaluates every annotation in it, so this is
+    cached per module, keyed on the module's raw annotations so that any
+    added or re-annotated global invalidates the entry.
+
+    Args:
+        mod: a module in the `sys.modules`.
+
+    Returns:
+        A read-only mapping of global names to their (fully-resolved) annotations.
+    """
+    annotations = tuple(getattr(mod, "__annotations__", {}).items())
+    return MappingProxyType(call_cached(_get_module_type_hints, mod, annotations))
+
+
+@lru_cache
+def _get_module_type_hints(
+    mod: ModuleType, annotations: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    """Resolve type hints for a module, cached by `get_module_type_hints`."""
+    return get_type_hints(mod, include_extras=True)
+
+
+@lru_cache
+def _get_function_type_hints(fn: Callable[..., Any]) -> dict[str, Any]:
+    """Resolve type hints for a function, cached as they are needed for every call of a task."""
+    return get_type_hints(fn, include_extras=True)
+
+
+@lru_cache(maxsize=4096)
+def _typ_has_metadata(typ: Any, metadata: tuple[Any, ...]) -> bool:
+    """Check if a type is, or contains, an Annotated with the given metadata.
+
+    Cached on the metadata rather than the Annotated itself, so that
+    equivalent annotations share entries.
+    """
+    stack: list[Any] = [typ]
+    while stack:
+        current = stack.pop()
+        if type(current) is _AnnotatedAlias:
+            if current.__metadata__ == metadata:
+                return True
+            stack.extend(current.__args__)
+        else:
+            stack.extend(get_args(current))
+    return False
+
+
+def _walk_module_scope(node: ast.AST) -> Iterator[ast.AST]:
+    """Walk the statements that run in a module's own scope, in order.
+
+    Function and class bodies are skipped, as names imported within them do not
+    become module globals, and expressions are skipped as they cannot import.
+
+    Args:
+        node: the parsed module, or a statement within it.
+
+    Returns: an iterator over the module-scope statements (including nested blocks).
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+            continue
+        if isinstance(child, ast.stmt | ast.excepthandler | ast.match_case):
+            yield child
+            yield from _walk_module_scope(child)
 
 
 class FunctionAnalyser:
     """Convenience class for analysing a function with reduced duplication of effort.
 
     Attributes:
-        _fn: the wrapped callable
-        _annotations: stored annotations for the function.
+        fn: the wrapped callable
+        _unwrapped: the callable with any decorator layers removed.
+        _resolved_closure_vars: names referred to in the callable, once resolved.
+        _resolved_globals: globals and nonlocals of the callable, once resolved.
+        _resolved_module: module in which the callable was defined, once looked up.
     """
 
-    _fn: Callable[..., Any]
-    _annotations: dict[str, Any]
+    __slots__ = (
+        "fn",
+        "_unwrapped",
+        "_resolved_closure_vars",
+        "_resolved_globals",
+        "_resolved_module",
+    )
+
+    fn: Callable[..., Any]
+    _unwrapped: Callable[..., Any]
+    _resolved_closure_vars: ClosureVars | None
+    _resolved_globals: dict[str, Any] | None
+    _resolved_module: ModuleType | None
 
     def __init__(self, fn: Callable[..., Any]):
         """Set the function.
@@ -64,6 +150,10 @@ class FunctionAnalyser:
             self.fn = fn.__func__
         else:
             self.fn = fn
+        self._unwrapped = inspect.unwrap(self.fn)
+        self._resolved_closure_vars = None
+        self._resolved_globals = None
+        self._resolved_module = None
 
     @property
     def return_type(self) -> Any:
@@ -74,7 +164,7 @@ class FunctionAnalyser:
         Raises:
           ValueError: if the return value does not appear to be type-hinted.
         """
-        hints = get_type_hints(inspect.unwrap(self.fn), include_extras=True)
+        hints = _get_function_type_hints(self._unwrapped)
         if "return" not in hints or hints["return"] is None:
             raise ValueError(f"Could not find type-hint for return value of {self.fn}")
         typ = hints["return"]
@@ -92,24 +182,15 @@ class FunctionAnalyser:
         """
         if not hasattr(annotation, "__metadata__"):
             return False
-        if origin := get_origin(typ):
-            if (
-                origin is Annotated
-                and hasattr(typ, "__metadata__")
-                and typ.__metadata__ == annotation.__metadata__
-            ):
-                return True
-        if any(FunctionAnalyser._typ_has(arg, annotation) for arg in get_args(typ)):
-            return True
-        return False
+        return call_cached(_typ_has_metadata, typ, annotation.__metadata__)
 
     def get_all_module_names(self) -> dict[str, Any]:
         """Find all of the annotations within this module."""
-        return get_type_hints(sys.modules[self.fn.__module__], include_extras=True)
+        return dict(get_module_type_hints(self._module))
 
     def get_all_imported_names(self) -> dict[str, tuple[ModuleType, str]]:
         """Find all of the annotations that were imported into this module."""
-        return self._get_all_imported_names(sys.modules[self.fn.__module__])
+        return self._get_all_imported_names(self._module)
 
     @staticmethod
     @lru_cache
@@ -125,7 +206,7 @@ class FunctionAnalyser:
         """
         ast_tree = ast.parse(inspect.getsource(mod))
         imported_names = {}
-        for node in ast.walk(ast_tree):
+        for node in _walk_module_scope(ast_tree):
             if isinstance(node, ast.ImportFrom):
                 for name in node.names:
                     imported_names[name.asname or name.name] = (
@@ -162,12 +243,12 @@ class FunctionAnalyser:
         typ: type | None = None
         if typ := self.fn.__annotations__.get(arg):
             if isinstance(typ, str):
-                typ = get_type_hints(self.fn, include_extras=True).get(arg)
+                typ = _get_function_type_hints(self.fn).get(arg)
         elif exhaustive:
-            if anns := get_type_hints(
-                sys.modules[self.fn.__module__], include_extras=True
-            ):
-                if typ := anns.get(arg):
+            mod = self._module
+            # Only resolve the module's hints if this name is actually annotated there.
+            if anns := getattr(mod, "__annotations__", {}):
+                if arg in anns and (typ := get_module_type_hints(mod).get(arg)):
                     ...
                 elif orig_pair := self.get_all_imported_names().get(arg):
                     orig_module, orig_name = orig_pair
@@ -196,24 +277,61 @@ class FunctionAnalyser:
 
     def is_at_construct_arg(self, arg: str, exhaustive: bool = False) -> bool:
         """Convience function to check for `AtConstruct`, wrapping `FunctionAnalyser.argument_has`."""
-        return self.argument_has(arg, AtRender, exhaustive)
+        if arg in self._get_at_render_args(self.fn):
+            return True
+        return exhaustive and self.argument_has(arg, AtRender, exhaustive)
+
+    @staticmethod
+    @lru_cache
+    def _get_at_render_args(fn: Callable[..., Any]) -> frozenset[str]:
+        """Get the names of the arguments annotated as `AtRender` on the function itself.
+
+        Args:
+            fn: the function whose own annotations should be checked.
+
+        Returns:
+            The argument names, so that each check is only a set lookup.
+        """
+        at_render_args = set()
+        for arg, typ in fn.__annotations__.items():
+            if isinstance(typ, str):
+                typ = _get_function_type_hints(fn).get(arg)
+            if arg != "return" and typ and FunctionAnalyser._typ_has(typ, AtRender):
+                at_render_args.add(arg)
+        return frozenset(at_render_args)
+
+    @property
+    def _module(self) -> ModuleType:
+        """Look up the module in which this Callable was defined, once per analyser."""
+        if self._resolved_module is None:
+            self._resolved_module = sys.modules[self.fn.__module__]
+        return self._resolved_module
+
+    @property
+    def _closure_vars(self) -> ClosureVars:
+        """Resolve the names referred to in this Callable, once per analyser."""
+        if self._resolved_closure_vars is None:
+            self._resolved_closure_vars = getclosurevars(self.fn)
+        return self._resolved_closure_vars
 
     @property
     def globals(self) -> Mapping[str, Any]:
         """Get the globals for this Callable."""
-        try:
-            fn_tuple = getclosurevars(self.fn)
-            fn_globals = dict(fn_tuple.globals)
-            fn_globals.update(fn_tuple.nonlocals)
-        # This covers the case of wrapping, rather than decorating.
-        except TypeError:
-            fn_globals = {}
-        return fn_globals
+        if self._resolved_globals is None:
+            try:
+                fn_tuple = self._closure_vars
+                fn_globals = dict(fn_tuple.globals)
+                fn_globals.update(fn_tuple.nonlocals)
+            # This covers the case of wrapping, rather than decorating.
+            except TypeError:
+                fn_globals = {}
+            self._resolved_globals = fn_globals
+        return self._resolved_globals
 
     @property
     def unbound(self) -> dict[str, str | None]:
         """Get the globals for this Callable."""
-        fn_tuple = getclosurevars(self.fn)
+        fn_tuple = self._closure_vars
         unbound: dict[str, str | None] = {}
         for var in fn_tuple.unbound:
             if ":" in var:
@@ -225,14 +343,12 @@ class FunctionAnalyser:
 
     def with_new_globals(self, new_globals: dict[str, Any]) -> Callable[..., Any]:
         """Create a Callable that will run the current Callable with new globals."""
-        code = self.fn.__code__
-        fn_name = self.fn.__name__
-        all_globals = dict(self.globals)
-        all_globals.update(new_globals)
+        if not new_globals:
+            return self.fn
         return FunctionType(
-            code,
-            all_globals,
-            name=fn_name,
+            self.fn.__code__,
+            {**self.globals, **new_globals},
+            name=self.fn.__name__,
             closure=self.fn.__closure__,
             argdefs=self.fn.__defaults__,
         )
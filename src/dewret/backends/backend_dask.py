@@ -17,14 +17,14 @@
 Lazy-evaluation via `dask.delayed`.
 """
 
-from dask.delayed import delayed, DelayedLeaf
+from dask.base import compute
+from dask.delayed import delayed, Delayed as DaskDelayed, DelayedLeaf
 from dask.config import config
-from typing import Protocol, runtime_checkable, Any, cast
+from typing import Protocol, Any, TypeGuard, cast
 from concurrent.futures import ThreadPoolExecutor
 from dewret.workflow import Workflow, Lazy, StepReference, Target
 
 
-@runtime_checkable
 class Delayed(Protocol):
     """Description of a dask `delayed`.
 
@@ -79,6 +79,21 @@ def unwrap(task: Lazy) -> Target:
     return cast(Target, task._obj)
 
 
+def _is_delayed(task: Any) -> TypeGuard[Delayed]:
+    """Checks if a value is a `dask.delayed`.
+
+    This checks against dask's concrete class, as checking against the runtime
+    protocol would inspect each of its members on every call.
+
+    Args:
+        task: suspected `dask.delayed`.
+
+    Returns:
+        True if so, False otherwise.
+    """
+    return isinstance(task, DaskDelayed)
+
+
 def is_lazy(task: Any) -> bool:
     """Checks if a task is really a lazy-evaluated function for this backend.
 
@@ -88,7 +103,7 @@ def is_lazy(task: Any) -> bool:
     Returns:
         True if so, False otherwise.
     """
-    return isinstance(task, Delayed) or (
+    return _is_delayed(task) or (
         isinstance(task, tuple | list) and all(is_lazy(elt) for elt in task)
     )
 
@@ -114,10 +129,12 @@ def run(
     """
     # def _check_delayed was here, but we decided to delegate this to dask
 
-    if isinstance(task, Delayed) and is_lazy(task):
-        computable = task
-    else:
-        computable = delayed(task)
     config["pool"] = thread_pool
+    if isinstance(task, list | tuple):
+        # Compute the existing graphs together, rather than wrapping them in a new delayed.
+        results = compute(*task, __workflow__=workflow)  # type: ignore
+        return list(results) if isinstance(task, list) else results
+
+    computable = task if _is_delayed(task) else delayed(task)
     result = computable.compute(__workflow__=workflow)
     return result
@@ -21,7 +21,7 @@ and WorkflowComponents, that are concretized elsewhere.
 from dataclasses import dataclass
 import importlib
 import base64
-from attrs import define
+from attrs import define, evolve
 from functools import lru_cache
 from typing import (
     Generic,
@@ -38,12 +38,15 @@ from typing import (
     Annotated,
     Callable,
     cast,
-    runtime_checkable,
+    TypeGuard,
+    TYPE_CHECKING,
 )
 from contextlib import contextmanager
 from contextvars import ContextVar
 from sympy import Expr, Symbol, Basic
-import copy
+
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
 
 BasicType = str | float | bool | bytes | int | None
 RawType = BasicType | list["RawType"] | dict[str, "RawType"]
@@ -55,6 +58,24 @@ U = TypeVar("U")
 T = TypeVar("T")
 
 
+def call_cached(cached_fn: "_lru_cache_wrapper[T]", *args: Any) -> T:
+    """Call an `lru_cache`-wrapped function, bypassing the cache for unhashable arguments.
+
+    Annotated metadata, for instance, need not be hashable, in which case we cannot cache.
+
+    Args:
+        cached_fn: function wrapped by `functools.lru_cache`.
+        *args: arguments to pass to the function.
+
+    Returns: the result of the function.
+    """
+    try:
+        hash(args)
+    except TypeError:
+        return cached_fn.__wrapped__(*args)
+    return cached_fn(*args)
+
+
 def strip_annotations(parent_type: type) -> tuple[type, tuple[str]]:
     """Discovers and removes annotations from a parent type.
 
@@ -64,17 +85,32 @@ def strip_annotations(parent_type: type) -> tuple[type, tuple[str]]:
     Returns: a parent type that is not Annotation, along with any stripped metadata, if present.
 
     """
+    # Equal types need not be the same (e.g. `int | str` and `Union[str, int]`), so
+    # only the metadata is cached and the stripped type is always the caller's own.
+    metadata = call_cached(_annotation_metadata, parent_type)
+    while get_origin(parent_type) is Annotated:
+        parent_type = get_args(parent_type)[0]
+    return parent_type, metadata
+
+
+@lru_cache(maxsize=2048)
+def _annotation_metadata(parent_type: type) -> tuple[str]:
+    """Collect the metadata of any annotations on a type, cached by `strip_annotations`."""
     # Strip out any annotations. This should be auto-flattened, so in theory only one iteration could occur.
     metadata = []
     while get_origin(parent_type) is Annotated:
         parent_type, *parent_metadata = get_args(parent_type)
         metadata += list(parent_metadata)
-    return parent_type, tuple(metadata)
+    return tuple(metadata)
 
 
 # Generic type for configuration settings for the renderer
 RenderConfiguration = dict[str, RawType]
 
+# sympy hashes Symbols by concatenating their name with this tuple of assumptions,
+# so our expressions, which have none, can all share one empty tuple.
+EMPTY_ASSUMPTIONS: tuple[()] = ()
+
 
 class WorkflowProtocol(Protocol):
     """Expected structure for a workflow.
@@ -119,7 +155,6 @@ class BaseRenderModule(Protocol):
         ...
 
 
-@runtime_checkable
 class RawRenderModule(BaseRenderModule, Protocol):
     """Render module that returns raw text."""
 
@@ -133,7 +168,6 @@ class RawRenderModule(BaseRenderModule, Protocol):
         ...
 
 
-@runtime_checkable
 class StructuredRenderModule(BaseRenderModule, Protocol):
     """Render module that returns JSON/YAML-serializable structures."""
 
@@ -147,6 +181,36 @@ class StructuredRenderModule(BaseRenderModule, Protocol):
         ...
 
 
+def is_raw_render_module(module: object) -> TypeGuard[RawRenderModule]:
+    """Check if a module provides the routines of a `RawRenderModule`.
+
+    This matches what a runtime-checkable protocol would, without inspecting the
+    protocol's members on every check.
+
+    Args:
+        module: the (suspected) render module.
+
+    Returns: True if the module has `render_raw` and `default_config`, otherwise False.
+    """
+    return hasattr(module, "render_raw") and hasattr(module, "default_config")
+
+
+def is_structured_render_module(
+    module: object,
+) -> TypeGuard[StructuredRenderModule]:
+    """Check if a module provides the routines of a `StructuredRenderModule`.
+
+    This matches what a runtime-checkable protocol would, without inspecting the
+    protocol's members on every check.
+
+    Args:
+        module: the (suspected) render module.
+
+    Returns: True if the module has `render` and `default_config`, otherwise False.
+    """
+    return hasattr(module, "render") and hasattr(module, "default_config")
+
+
 class RenderCall(Protocol):
     """Callable that will render out workflow(s)."""
 
@@ -255,14 +319,17 @@ def _set_configuration() -> Iterator[ContextVar[GlobalConfiguration]]:
 
     This is a context manager, so that a setting can be temporarily overridden and automatically restored.
     """
-    try:
-        previous = CONFIGURATION.get()
-    except LookupError:
+    if (previous := CONFIGURATION.get(None)) is None:
+        # The render defaults are cached, so they must be copied before being updated.
         previous = GlobalConfiguration(
-            construct=ConstructConfiguration(), render=default_renderer_config()
+            construct=ConstructConfiguration(), render=dict(default_renderer_config())
         )
         CONFIGURATION.set(previous)
-    previous = copy.deepcopy(previous)
+    # The construct settings are flat and the render settings are only ever
+    # updated at the top level, so a shallow snapshot is enough to restore them.
+    previous = GlobalConfiguration(
+        construct=evolve(previous.construct), render=dict(previous.render)
+    )
 
     try:
         yield CONFIGURATION
@@ -292,7 +359,16 @@ def default_renderer_config() -> RenderConfiguration:
     return default_config()
 
 
-@lru_cache
+# Shared by every lookup made outside a configuration scope, so must never be modified.
+_DEFAULT_CONSTRUCT_CONFIGURATION = ConstructConfiguration(
+    flatten_all_nested=False,
+    allow_positional_args=False,
+    allow_plain_dict_fields=False,
+    field_separator="/",
+    field_index_types="int",
+)
+
+
 def default_construct_config() -> ConstructConfiguration:
     """Gets the default construct-time configuration.
 
@@ -302,13 +378,7 @@ def default_construct_config() -> ConstructConfiguration:
 
     Returns: configuration dictionary with default construct values.
     """
-    return ConstructConfiguration(
-        flatten_all_nested=False,
-        allow_positional_args=False,
-        allow_plain_dict_fields=False,
-        field_separator="/",
-        field_index_types="int",
-    )
+    return _DEFAULT_CONSTRUCT_CONFIGURATION
 
 
 def get_configuration(key: str) -> RawType:
@@ -323,11 +393,10 @@ def get_configuration(key: str) -> RawType:
 
     Returns: (preferably) a JSON/YAML-serializable construct.
     """
-    try:
-        return getattr(CONFIGURATION.get().construct, key)  # type: ignore
-    except LookupError:
+    if (configuration := CONFIGURATION.get(None)) is None:
         # TODO: Not sure what the best way to typehint this is.
-        return getattr(ConstructConfiguration(), key)  # type: ignore
+        return getattr(_DEFAULT_CONSTRUCT_CONFIGURATION, key)  # type: ignore
+    return getattr(configuration.construct, key)  # type: ignore
 
 
 def get_render_configuration(key: str) -> RawType:
@@ -341,10 +410,9 @@ def get_render_configuration(key: str) -> RawType:
 
     Returns: (preferably) a JSON/YAML-serializable construct.
     """
-    try:
-        return CONFIGURATION.get().render.get(key)
-    except LookupError:
+    if (configuration := CONFIGURATION.get(None)) is None:
         return default_renderer_config().get(key)
+    return configuration.render.get(key)
 
 
 class WorkflowComponent:
@@ -405,7 +473,7 @@ class Reference(Generic[U], Symbol, WorkflowComponent):
     def __new__(cls, *args: Any, **kwargs: Any) -> "Reference[U]":
         """As all references are sympy Expressions, the real returned object must be made with Expr."""
         instance = Expr.__new__(cls)
-        instance._assumptions0 = {}
+        instance._assumptions0 = EMPTY_ASSUMPTIONS
         return cast(Reference[U], instance)
 
     @property
@@ -439,9 +507,10 @@ class Reference(Generic[U], Symbol, WorkflowComponent):
         Raises:
             UnevaluatableError: if it seems the user is confusing this with a runtime check.
         """
-        if isinstance(other, list) or other is None:
+        if other is None or isinstance(other, list):
             return False
-        if not isinstance(other, Reference) and not isinstance(other, Basic):
+        # References are sympy symbols, so this also covers them.
+        if not isinstance(other, Basic):
             self._raise_unevaluatable_error()
         return super().__eq__(other)
 
@@ -506,7 +575,9 @@ class IterableMixin(Reference[U]):
         """
         super().__init__(typ=typ, **kwargs)
         base = strip_annotations(self.__type__)[0]
-        if get_origin(base) == tuple and (args := get_args(base)):
+        if getattr(base, "__origin__", None) is tuple and (
+            args := getattr(base, "__args__", None)
+        ):
             # In the special case of an explicitly-typed tuple, we can state a length.
             self.__fixed_len__ = len(args)
 
@@ -600,6 +671,23 @@ class IteratedGenerator(Generic[U]):
             yield ref
 
 
+# Only small values are cached, as the cache keeps both the bytes and their encoding alive.
+_MAX_CACHED_BYTES = 4096
+
+
+@lru_cache(maxsize=64)
+def _encode_small_bytes(value: bytes) -> str:
+    """Encode small raw bytes as text, cached as `Raw` values are repeatedly hashed."""
+    return base64.b64encode(value).decode("ascii")
+
+
+def _encode_bytes(value: bytes) -> str:
+    """Encode raw bytes as text, only caching small values."""
+    if len(value) > _MAX_CACHED_BYTES:
+        return base64.b64encode(value).decode("ascii")
+    return _encode_small_bytes(value)
+
+
 @dataclass
 class Raw:
     """Value object for any raw types.
@@ -621,7 +709,7 @@ class Raw:
         """Convert to a consistent, string representation."""
         value: str
         if isinstance(self.value, bytes):
-            value = base64.b64encode(self.value).decode("ascii")
+            value = _encode_bytes(self.value)
         else:
             value = str(self.value)
         return f"{type(self.value).__name__}|{value}"
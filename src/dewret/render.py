@@ -21,6 +21,7 @@ renderers to reuse to build up their own functionality.
 import sys
 from pathlib import Path
 from functools import partial
+from collections.abc import Iterator, Mapping
 from typing import TypeVar, Callable, ContextManager, IO, Any, cast
 import yaml
 
@@ -32,9 +33,16 @@ from .core import (
     RawRenderModule,
     StructuredRenderModule,
     RenderConfiguration,
+    is_raw_render_module,
+    is_structured_render_module,
 )
 from .utils import load_module_or_package
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper  # type: ignore
+
 T = TypeVar("T")
 
 
@@ -48,12 +56,46 @@ def structured_to_raw(rendered: RawType, pretty: bool = False) -> str:
     Returns: YAML/stringified version of the structure.
     """
     if pretty:
-        output = yaml.safe_dump(rendered, indent=2)
+        output = yaml.dump(rendered, indent=2, Dumper=_Dumper)
     else:
         output = str(rendered)
     return output
 
 
+class _SerializedMapping(Mapping[str, str]):
+    """Read-only view serializing each rendered (sub)workflow only when it is accessed.
+
+    This avoids holding every serialized workflow in memory at once while
+    they are written out one by one. See `get_lazy_render_method`.
+    """
+
+    def __init__(self, rendered: Mapping[str, RawType], pretty: bool):
+        self._rendered = rendered
+        self._pretty = pretty
+
+    def __getitem__(self, key: str) -> str:
+        return structured_to_raw(self._rendered[key], pretty=self._pretty)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rendered)
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+
+def _load_render_module(
+    renderer: Path | RawRenderModule | StructuredRenderModule,
+) -> BaseRenderModule:
+    """Load a renderer module from a path, if it is not already a module."""
+    if isinstance(renderer, Path):
+        # Attempt to load renderer as package, falling back to a single module otherwise.
+        # This enables relative imports in renderers and therefore the ability to modularize.
+        module = load_module_or_package("__renderer__", renderer)
+        sys.modules["__renderer_mod__"] = module
+        return cast(BaseRenderModule, module)
+    return renderer
+
+
 def get_render_method(
     renderer: Path | RawRenderModule | StructuredRenderModule, pretty: bool = False
 ) -> RenderCall:
@@ -65,19 +107,11 @@ def get_render_method(
 
     Returns: a callable with a consistent interface, regardless of the renderer type.
     """
-    render_module: BaseRenderModule
-    if isinstance(renderer, Path):
-        # Attempt to load renderer as package, falling back to a single module otherwise.
-        # This enables relative imports in renderers and therefore the ability to modularize.
-        module = load_module_or_package("__renderer__", renderer)
-        sys.modules["__renderer_mod__"] = module
-        render_module = cast(BaseRenderModule, module)
-    else:
-        render_module = renderer
+    render_module = _load_render_module(renderer)
 
-    if isinstance(render_module, RawRenderModule):
+    if is_raw_render_module(render_module):
         return render_module.render_raw
-    elif isinstance(render_module, (StructuredRenderModule)):
+    elif is_structured_render_module(render_module):
 
         def _render(
             workflow: Workflow,
@@ -100,12 +134,54 @@ def get_render_method(
     )
 
 
+def get_lazy_render_method(
+    renderer: Path | RawRenderModule | StructuredRenderModule, pretty: bool = False
+) -> Callable[..., Mapping[str, str]]:
+    """Create a callable to render the workflow, serializing each (sub)workflow only when read.
+
+    Unlike `get_render_method`, structured renderers' output is not serialized
+    up front, so that `write_rendered_output` can write each (sub)workflow out
+    without every serialized workflow being held in memory at once. Each read
+    of an entry serializes it again, so entries should be read once.
+
+    Args:
+        renderer: a module or path to a module.
+        pretty: whether the renderer should attempt to YAML-format the output (if relevant).
+
+    Returns: a callable returning a read-only mapping of keys to serialized workflows.
+    """
+    render_module = _load_render_module(renderer)
+
+    if is_raw_render_module(render_module):
+        return render_module.render_raw
+    elif is_structured_render_module(render_module):
+
+        def _render(
+            workflow: Workflow,
+            render_module: StructuredRenderModule,
+            pretty: bool = False,
+            **kwargs: RenderConfiguration,
+        ) -> Mapping[str, str]:
+            rendered = render_module.render(workflow, **kwargs)
+            return _SerializedMapping(rendered, pretty=pretty)
+
+        return partial(_render, render_module=render_module, pretty=pretty)
+
+    raise NotImplementedError(
+        "This render module neither seems to be a structured nor a raw render module."
+    )
+
+
 def write_rendered_output(
-    rendered: dict[str, str] | dict[str, RawType],
+    rendered: Mapping[str, str] | Mapping[str, RawType],
     output: str,
     opener: Callable[[str, str], ContextManager[IO[Any]]],
 ) -> None:
-    """Utility function to handle writing rendered output to file or stdout."""
+    """Utility function to handle writing rendered output to file or stdout.
+
+    Entries are looked up one at a time, so a lazily-serialized `rendered`
+    mapping only serializes each (sub)workflow as it is written.
+    """
     if len(rendered) == 1:
         with opener("", "w") as output_f:
             output_f.write(rendered["__root__"])
@@ -118,11 +194,12 @@ def write_rendered_output(
     else:
         with opener("ROOT", "w") as output_f:
             output_f.write(rendered["__root__"])
-        del rendered["__root__"]
-        for key, value in rendered.items():
+        for key in rendered:
+            if key == "__root__":
+                continue
             with opener(key, "a") as output_f:
                 output_f.write("\n---\n")
-                output_f.write(value)
+                output_f.write(rendered[key])
 
 
 def base_render(workflow: Workflow, build_cb: Callable[[Workflow], T]) -> dict[str, T]:
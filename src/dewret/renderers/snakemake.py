@@ -20,9 +20,9 @@ current workflow.
 """
 
 import os
-import yaml
 import inspect
 import typing
+from functools import lru_cache
 
 from attrs import define
 
@@ -34,7 +34,7 @@ from dewret.core import (
 from dewret.workflow import (
     Workflow,
     Task,
-    Lazy,
+    Target,
     BaseStep,
 )
 from dewret.render import (
@@ -43,6 +43,8 @@ from dewret.render import (
 
 MainTypes = BasicType | list[str] | list["MainTypes"] | dict[str, "MainTypes"]
 
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
 
 @define
 class ReferenceDefinition:
@@ -81,7 +83,10 @@ class ReferenceDefinition:
         return self.source
 
 
-# TODO: Refactor: better way to handle the types.
+# Raw types whose string form can be used as-is in a Snakefile.
+_VERBATIM_TYPES = frozenset({"bool", "dict", "list", "float", "int"})
+
+
 def to_snakemake_type(param: Raw) -> str:
     """Convert a raw type to a corresponding Snakemake-compatible Python type.
 
@@ -99,25 +104,21 @@ def to_snakemake_type(param: Raw) -> str:
         TypeError: If the parameter's type cannot be mapped to a known Python type.
     """
     typ = str(param)
-    if typ.__contains__("str"):
-        return f'"{typ.replace("str|", "")}"'
-    elif typ.__contains__("bool"):
-        return typ.replace("bool|", "")
-    elif typ.__contains__("dict"):
-        return typ.replace("dict|", "")
-    elif typ.__contains__("list"):
-        return typ.replace("list|", "")
-    elif typ.__contains__("float"):
-        return typ.replace("float|", "")
-    elif typ.__contains__("int"):
-        return typ.replace("int|", "")
+    kind, _, value = typ.partition("|")
+    if kind == "str":
+        return f'"{value}"'
+    elif kind in _VERBATIM_TYPES:
+        return value
     else:
         raise TypeError(f"Cannot render complex type ({typ})")
 
 
-def get_method_args(func: Lazy) -> inspect.Signature:
+@lru_cache
+def get_method_args(func: Target) -> inspect.Signature:
     """Retrieve the argument names and types of a lazy-evaluatable function.
 
+    This is cached, as the same task is typically used by many steps.
+
     Args:
         func: A function that adheres to the `Lazy` protocol.
 
@@ -130,20 +131,33 @@ def get_method_args(func: Lazy) -> inspect.Signature:
     return args
 
 
-def get_method_rel_path(func: Lazy) -> typing.Any:
+@lru_cache
+def _get_source_file(func: Target) -> str | None:
+    """Find the source file of a function, caching as many steps share each task."""
+    return inspect.getsourcefile(func)
+
+
+def get_method_rel_path(func: Target) -> typing.Any:
     """Get the relative path of the module containing the given function.
 
     Args:
-        func (Lazy): The function for which the relative path is to be determined.
+        func (Target): The function for which the relative path is to be determined.
 
     Returns:
         any: The relative path of the module containing the function.
 
     Note:
-        This function relies on the `inspect` and `os` modules to compute its relative path.
+        Where the function belongs to a normally-imported module, its import name is used
+        directly. Otherwise, for instance for a script run as `__main__` or a workflow loaded
+        by the dewret CLI, this relies on the `inspect` and `os` modules to compute its
+        relative path.
     """
+    module_name = getattr(func, "__module__", None)
+    if module_name and not module_name.startswith("__"):
+        return module_name
+
     # TODO: error handling
-    source_file = inspect.getsourcefile(func)
+    source_file = _get_source_file(func)
     if source_file:
         relative_path = os.path.relpath(source_file, start=os.getcwd())
         module_name = os.path.splitext(relative_path)[0].replace(os.path.sep, ".")
@@ -181,25 +195,22 @@ class InputDefinition:
         Returns:
             InputDefinition: An InputDefinition object.
         """
-        params = []
-        inputs = []
+        params: list[str] = []
+        inputs: list[str] = []
+        add_param, add_input = params.append, inputs.append
         for key, param in step.arguments.items():
             if isinstance(param, Reference):
                 ref = (
                     ReferenceDefinition.from_reference(param)
                     .render()
-                    .replace("-", "_")
+                    .translate(_DASH_TO_UNDERSCORE)
                     .replace("/out", ".output")
                 )
                 input = f"{key}=rules.{ref}.output_file"
-                inputs.append(input)
-                params.append(input + ",")
+                add_input(input)
+                add_param(input)
             elif isinstance(param, Raw):
-                customized = f"{key}={to_snakemake_type(param)},"
-                params.append(customized)
-
-        if params:
-            params[len(params) - 1] = params[len(params) - 1].replace(",", "")
+                add_param(f"{key}={to_snakemake_type(param)}")
 
         return cls(inputs=inputs, params=params)
 
@@ -210,7 +221,9 @@ class InputDefinition:
             dict[str, list[MainTypes]]: A dictionary containing the input and parameter definitions,
                 for use in Snakemake Input and Params blocks.
         """
-        return {"inputs": self.inputs, "params": self.params}
+        # Snakemake needs a comma between each parameter, but not after the last.
+        params = [f"{param}," for param in self.params[:-1]] + self.params[-1:]
+        return {"inputs": self.inputs, "params": params}
 
 
 @define
@@ -255,7 +268,6 @@ class OutputDefinition:
         Returns:
             list[str]: A list containing the output file definition, for use in a Snakemake Output block.
         """
-        # The comma after the last element is mandatory for the structure of rule onces it's used in yaml.dump
         return [
             f"output_file={self.output_file}",
         ]
@@ -296,9 +308,11 @@ class RunDefinition:
                 information and arguments.
         """
         if isinstance(task, Task):
-            relative_path = get_method_rel_path(task.target)
+            # Lazy does not declare __hash__, but any real target is hashable.
+            target: Target = task.target
+            relative_path = get_method_rel_path(target)
             rel_import = f"{relative_path}"
-            args = get_method_args(task.target)
+            args = get_method_args(target)
         else:
             # TODO: Add implementation for multiple workflows
             pass
@@ -316,11 +330,10 @@ class RunDefinition:
             list[str]: A list containing the import statement and the method
                 call statement, for use in Snakemake run block.
         """
-        signature = ", ".join(f"{arg}" for arg in self.args)
-        # The comma after the last element is mandatory for the structure of rule onces it's used in yaml.dump
+        signature = ", ".join(self.args)
         return [
-            f"import {self.rel_import}\n",
-            f"{self.rel_import}.{self.method_name}({signature})\n",
+            f"import {self.rel_import}",
+            f"{self.rel_import}.{self.method_name}({signature})",
         ]
 
 
@@ -330,6 +343,7 @@ class StepDefinition:
 
     Attributes:
         name (str): The name of the step.
+        safe_name (str): The name of the step, usable as a Snakemake rule name.
         run (str): The run block definition for the step.
         params (List[str]): The parameter definitions for the step.
         output (list[str]: The output definition for the step.
@@ -344,6 +358,7 @@ class StepDefinition:
     """
 
     name: str
+    safe_name: str
     run: list[str]
     params: list[str]
     output: list[str]
@@ -366,6 +381,7 @@ class StepDefinition:
         output_block = OutputDefinition.from_step(step).render()
         return cls(
             name=step.name,
+            safe_name=step.name.translate(_DASH_TO_UNDERSCORE),
             run=run_block,
             params=input_block["params"],
             input=input_block["inputs"],
@@ -387,7 +403,6 @@ class StepDefinition:
         }
 
 
-# TODO: Find out why the yaml.dump scrambles the order of the rules
 # TODO: Add a rule all: with input definition the last outputed file
 
 
@@ -422,7 +437,8 @@ class WorkflowDefinition:
         Returns:
             str: WorkflowDefinition with definited steps.
         """
-        return cls(steps=[StepDefinition.from_step(step) for step in workflow.steps])
+        from_step = StepDefinition.from_step
+        return cls(steps=[from_step(step) for step in workflow.steps])
 
     def render(self) -> dict[str, MainTypes]:
         """Render the WorkflowDefinition.
@@ -431,9 +447,34 @@ class WorkflowDefinition:
             dict[str, MainTypes]: A dictionary containing the components of the Workflow
                 definition, for use in Snakemake workflows.
         """
-        return {
-            f"rule {step.name.replace('-', '_')}": step.render() for step in self.steps
-        }
+        return {f"rule {step.safe_name}": step.render() for step in self.steps}
+
+
+def _dump_snakefile(rules: dict[str, MainTypes]) -> str:
+    """Write out rendered rules as Snakefile text.
+
+    The rendered structure has a fixed shape - rules, containing blocks, containing
+    lines - so it is written directly rather than going through a YAML emitter.
+    Rules and blocks are sorted by name, as the workflow steps are unordered.
+
+    Args:
+        rules: rendered rules, as returned by `raw_render`.
+
+    Returns:
+        str: the rules as a Snakefile.
+    """
+    lines: list[str] = []
+    for rule_name, rule in sorted(rules.items()):
+        if not isinstance(rule, dict):
+            raise TypeError(f"Cannot write rule {rule_name} of type {type(rule)}")
+        if lines:
+            lines.append("")
+        lines.append(f"{rule_name}:")
+        for block_name, block in sorted(rule.items()):
+            lines.append(f"    {block_name}:")
+            if isinstance(block, list):
+                lines.extend(f"        {line!s}" for line in block)
+    return "\n".join(lines) + "\n"
 
 
 def raw_render(workflow: Workflow) -> dict[str, MainTypes]:
@@ -454,26 +495,12 @@ def raw_render(workflow: Workflow) -> dict[str, MainTypes]:
 def render(workflow: Workflow) -> dict[str, typing.Any]:
     """Render the workflow as a Snakemake (SMK) string.
 
-    This function converts a Workflow object into a Snakemake-compatible yaml.
+    This function converts a Workflow object into Snakefile text.
 
     Args:
         workflow (Workflow): The workflow to be rendered.
 
     Returns:
-        str: A Snakemake-compatible yaml representation of the workflow.
+        str: A Snakemake-compatible representation of the workflow.
     """
-    trans_table = str.maketrans(
-        {
-            "-": "   ",
-            "'": "",
-            "[": "",
-            "]": "",
-        }
-    )
-
-    return base_render(
-        workflow,
-        lambda workflow: yaml.dump(
-            WorkflowDefinition.from_workflow(workflow).render(), indent=4
-        ).translate(trans_table),
-    )
+    return base_render(workflow, lambda workflow: _dump_snakefile(raw_render(workflow)))
@@ -227,9 +227,10 @@ class TaskManager:
                 for var, value in context:
                     var.set(value)
 
-            thread_pool = ThreadPoolExecutor(initializer=_initializer)
-
-            result = self.evaluate(task, workflow, thread_pool=thread_pool, **kwargs)
+            with ThreadPoolExecutor(initializer=_initializer) as thread_pool:
+                result = self.evaluate(
+                    task, workflow, thread_pool=thread_pool, **kwargs
+                )
             simplify_ids = bool(get_configuration("simplify_ids"))
         return Workflow.from_result(result, simplify_ids=simplify_ids)
 
@@ -99,7 +99,14 @@ def load_module_or_package(target_name: str, path: Path) -> ModuleType:
             if spec is None or spec.loader is None:
                 raise ImportError(f"Could not open {path} module")
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # Register before executing, as the package path does, so that the
+            # module's contents can find it (e.g. when analysing annotations).
+            sys.modules[target_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(target_name, None)
+                raise
         except ImportError as exc:
             if exception:
                 raise exc from exception
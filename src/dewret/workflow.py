@@ -57,6 +57,7 @@ from .core import (
     WorkflowProtocol,
     WorkflowComponent,
     ExprType,
+    EMPTY_ASSUMPTIONS,
 )
 from .utils import hasher, is_raw, make_traceback, is_raw_type, is_expr, Unset
 
@@ -238,7 +239,7 @@ class Parameter(Generic[T], Symbol):
         we must instantiate via it.
         """
         instance = Expr.__new__(cls)
-        instance._assumptions0 = {}
+        instance._assumptions0 = EMPTY_ASSUMPTIONS
         return cast(Parameter[T], instance)
 
     def __hash__(self) -> int:
@@ -1,12 +1,23 @@
 """Verify we can interrogate annotations."""
 
+import sys
 import pytest
+from functools import lru_cache
 import yaml
+from pathlib import Path
+from types import ModuleType, UnionType
+from typing import Union
 
 from dewret.tasks import construct, workflow, TaskException
 from dewret.renderers.cwl import render
-from dewret.annotations import AtRender, FunctionAnalyser, Fixed
-from dewret.core import set_configuration
+from dewret.annotations import (
+    AtRender,
+    FunctionAnalyser,
+    Fixed,
+    get_module_type_hints,
+)
+from dewret.core import call_cached, set_configuration, strip_annotations
+from dewret.utils import load_module_or_package
 
 from ._lib.extra import increment, sum, try_nothing
 
@@ -74,6 +85,85 @@ def test_can_analyze_annotations() -> None:
     assert analyser.argument_has("ARG1", AtRender) is False
 
 
+def test_module_type_hints_follow_reannotation() -> None:
+    """Test that cached module hints are refreshed when a global is re-annotated.
+
+    Also checks that callers cannot alter the cached hints.
+    """
+    mod = ModuleType("reannotated")
+    mod.__annotations__ = {"ARG": int}
+    assert get_module_type_hints(mod) == {"ARG": int}
+
+    mod.__annotations__["ARG"] = AtRender[int]
+    hints = get_module_type_hints(mod)
+    assert hints == {"ARG": AtRender[int]}
+
+    with pytest.raises(TypeError):
+        hints["ARG"] = int  # type: ignore
+
+
+def test_can_analyze_loaded_module(tmp_path: Path) -> None:
+    """Test that a workflow file loaded from a path can be analysed.
+
+    The module must be in `sys.modules` while it runs, but not left there if it fails.
+    """
+    workflow_py = tmp_path / "workflow.py"
+    workflow_py.write_text(
+        "from dewret.annotations import AtRender\n"
+        "FLAG: AtRender[bool] = True\n"
+        "def fn(num: int) -> int:\n"
+        "    return num\n"
+    )
+    try:
+        module = load_module_or_package("loaded_workflow", workflow_py)
+        analyser = FunctionAnalyser(module.fn)
+        assert analyser.get_all_module_names() == {"FLAG": AtRender[bool]}
+        assert analyser.argument_has("FLAG", AtRender, exhaustive=True) is True
+    finally:
+        sys.modules.pop("loaded_workflow", None)
+
+    broken_py = tmp_path / "broken.py"
+    broken_py.write_text("raise ImportError('broken')\n")
+    with pytest.raises(ImportError):
+        load_module_or_package("broken_workflow", broken_py)
+    assert "broken_workflow" not in sys.modules
+
+
+def test_cached_calls_only_bypass_cache_for_unhashable_arguments() -> None:
+    """Test that errors raised by a cached function are not mistaken for unhashable arguments."""
+    calls = []
+
+    @lru_cache
+    def fail(value: object) -> None:
+        calls.append(value)
+        raise TypeError("failed")
+
+    with pytest.raises(TypeError, match="failed"):
+        call_cached(fail, 1)
+    assert calls == [1]
+
+    @lru_cache
+    def count(value: object) -> int:
+        return len(value)  # type: ignore
+
+    assert call_cached(count, [1, 2]) == 2
+    assert count.cache_info().currsize == 0
+
+
+def test_strip_annotations_returns_the_given_type() -> None:
+    """Test that equal but distinct types are not swapped for one another by caching."""
+    assert strip_annotations(Union[int, str]) == (Union[int, str], ())
+
+    typ, metadata = strip_annotations(str | int)
+    assert isinstance(typ, UnionType)
+    assert typ.__args__ == (str, int)
+    assert metadata == ()
+
+    typ, metadata = strip_annotations(AtRender[str | int])
+    assert isinstance(typ, UnionType)
+    assert metadata == ("AtRender",)
+
+
 def test_at_render() -> None:
     """Test the rendering of workflows with `dewret.annotations.AtRender` and exceptions handling."""
     with pytest.raises(TaskException) as _:
@@ -0,0 +1,20 @@
+"""Verify command line options are parsed as expected."""
+
+import pytest
+from dewret.__main__ import _parse_key_vals
+
+
+def test_option_values_are_typed_where_possible() -> None:
+    """Check that option values are read as JSON, falling back to strings."""
+    assert _parse_key_vals("simplify_ids:false") == {"simplify_ids": False}
+    assert _parse_key_vals("simplify_ids:true,count:3,name:abc") == {
+        "simplify_ids": True,
+        "count": 3,
+        "name": "abc",
+    }
+
+
+def test_option_without_value_is_rejected() -> None:
+    """Check that an option with no colon separator raises an error."""
+    with pytest.raises(RuntimeError, match="'simplify_ids'"):
+        _parse_key_vals("name:abc,simplify_ids")
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 from dewret.tasks import construct
-from dewret.render import get_render_method
+from dewret.render import get_lazy_render_method, get_render_method
 
 from ._lib.extra import increment, triple_and_one
 
@@ -57,6 +57,19 @@ def test_can_load_cwl_render_module() -> None:
     }
 
 
+def test_lazy_render_matches_eager_render() -> None:
+    """Checks that lazily-serialized output has the same entries as the eager dict."""
+    result = triple_and_one(num=increment(num=3))
+    workflow = construct(result, simplify_ids=True)
+
+    cwl_py = Path(__file__).parent.parent / "src/dewret/renderers/cwl.py"
+    rendered = get_render_method(cwl_py)(workflow)
+    lazily_rendered = get_lazy_render_method(cwl_py)(workflow)
+
+    assert isinstance(rendered, dict)
+    assert dict(lazily_rendered) == rendered
+
+
 def test_get_correct_import_error_if_unable_to_load_render_module() -> None:
     """Check if the correct import error will be logged if unable to load render module."""
     unfrender_py = Path(__file__).parent / "_lib/unfrender.py"
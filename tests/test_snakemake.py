@@ -0,0 +1,77 @@
+"""Verify Snakemake output is OK."""
+
+import pytest
+from dewret.core import Raw
+from dewret.tasks import construct, task
+from dewret.renderers.snakemake import InputDefinition, render, to_snakemake_type
+
+
+@task()
+def download_data(data: str) -> str:
+    """Fetch some data."""
+    return data
+
+
+@task()
+def generate_report(processed_data: str, data_file: str) -> str:
+    """Report on the processed data."""
+    return processed_data
+
+
+def test_snakemake_rules() -> None:
+    """Check whether we can produce a simple Snakefile.
+
+    Each step becomes a rule, with parameters separated by commas
+    but no trailing comma after the last.
+    """
+    data = download_data(data="4, 5")
+    result = generate_report(processed_data=data, data_file=data)
+    workflow = construct(result, simplify_ids=True)
+    rendered = render(workflow)["__root__"]
+
+    assert rendered == (
+        "rule download_data_1:\n"
+        "    input:\n"
+        "        data=rules.download_data_1_data.output_file\n"
+        "    output:\n"
+        '        output_file="OUTPUT_FILE"\n'
+        "    params:\n"
+        "        data=rules.download_data_1_data.output_file\n"
+        "    run:\n"
+        "        import tests.test_snakemake\n"
+        "        tests.test_snakemake.download_data(data=params.data)\n"
+        "\n"
+        "rule generate_report_1:\n"
+        "    input:\n"
+        "        processed_data=rules.download_data_1.output_file\n"
+        "        data_file=rules.download_data_1.output_file\n"
+        "    output:\n"
+        '        output_file="OUTPUT_FILE"\n'
+        "    params:\n"
+        "        processed_data=rules.download_data_1.output_file,\n"
+        "        data_file=rules.download_data_1.output_file\n"
+        "    run:\n"
+        "        import tests.test_snakemake\n"
+        "        tests.test_snakemake.generate_report("
+        "processed_data=params.processed_data, data_file=params.data_file)\n"
+    )
+
+
+def test_snakemake_params_keep_commas_in_values() -> None:
+    """Check that only separating commas are added to, or removed from, params."""
+    inputs = InputDefinition(inputs=[], params=['label="4, 5"', "count=2"])
+    assert inputs.render()["params"] == ['label="4, 5",', "count=2"]
+
+    inputs = InputDefinition(inputs=[], params=['label="4, 5"'])
+    assert inputs.render()["params"] == ['label="4, 5"']
+
+
+def test_snakemake_types_use_prefix() -> None:
+    """Check that raw values are typed by their prefix, not their contents."""
+    assert to_snakemake_type(Raw("integer")) == '"integer"'
+    assert to_snakemake_type(Raw(["str"])) == "['str']"
+    assert to_snakemake_type(Raw(True)) == "True"
+    assert to_snakemake_type(Raw(3.5)) == "3.5"
+
+    with pytest.raises(TypeError):
+        to_snakemake_type(Raw(b"data"))